@@ -1,6 +1,4 @@
-#!/usr/bin/env -S LD_LIBRARY_PATH=lib python3
-# The LD_LIBRARY_PATH variable needs to be set here because without that
-# psycopg2 can't be imported due to missing libpq.so file (which is inside lib/)
+#!/usr/bin/env python3
 
 # Copyright 2024 Canonical Limited
 # See LICENSE file for licensing details.
@@ -8,6 +6,7 @@
 """Charm the Kyuubi service."""
 
 import logging
+from functools import cached_property
 
 import ops
 from charms.data_platform_libs.v0.data_models import TypedCharmBase
@@ -33,6 +32,7 @@ from events.metastore import MetastoreEvents
 from events.s3 import S3Events
 from events.upgrade import KyuubiDependencyModel, UpgradeEvents
 from events.zookeeper import ZookeeperEvents
+from managers.service import ServiceManager
 
 # Log messages can be retrieved using juju debug-log
 logger = logging.getLogger(__name__)
@@ -43,8 +43,12 @@ class KyuubiCharm(TypedCharmBase[CharmConfig]):
 
     config_type = CharmConfig
 
+    # State persisted across hooks
+    _stored = ops.StoredState()
+
     def __init__(self, *args):
         super().__init__(*args)
+        self._stored.set_default(s3_verification={})
 
         # Workload
         self.workload = KyuubiWorkload(
@@ -52,7 +56,9 @@ class KyuubiCharm(TypedCharmBase[CharmConfig]):
         )
 
         # Context
-        self.context = Context(model=self.model, config=self.config)
+        self.context = Context(
+            model=self.model, config=self.config, s3_verification=self.s3_verification
+        )
 
         # Event handlers
         self.kyuubi_events = KyuubiEvents(self, self.context, self.workload)
@@ -83,6 +89,20 @@ class KyuubiCharm(TypedCharmBase[CharmConfig]):
         # Server logs from Pebble
         self._log_forwarder = LogForwarder(self, relation_name=COS_LOG_RELATION_NAME_SERVER)
 
+    @property
+    def s3_verification(self) -> ops.StoredDict:
+        """The last successful S3 credentials verification."""
+        return self._stored.s3_verification  # type: ignore
+
+    @cached_property
+    def service_manager(self) -> ServiceManager:
+        """The manager of the Kyuubi K8s service, shared by all event handlers within a hook."""
+        return ServiceManager(
+            namespace=self.model.name,
+            unit_name=self.unit.name,
+            app_name=self.app.name,
+        )
+
 
 if __name__ == "__main__":  # pragma: nocover
     ops.main(KyuubiCharm)  # type: ignore
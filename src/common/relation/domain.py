@@ -7,6 +7,8 @@ from ops import Application, Relation, Unit
 class RelationState:
     """Relation state object."""
 
+    __slots__ = ("relation", "data_interface", "component", "relation_data")
+
     def __init__(
         self, relation: Relation | None, data_interface: Data, component: Unit | Application | None
     ):
@@ -29,10 +31,20 @@ class RelationState:
 
     def update(self, items: dict[str, str]) -> None:
         """Writes to relation_data."""
-        delete_fields = [key for key in items if not items[key]]
-        update_content = {k: items[k] for k in items if k not in delete_fields}
+        update_content, delete_fields = {}, []
+        for key, value in items.items():
+            if value:
+                update_content[key] = value
+            else:
+                delete_fields.append(key)
 
         self.relation_data.update(update_content)
 
-        for field in delete_fields:
-            del self.relation_data[field]
+        if not delete_fields:
+            return
+        if self.relation:
+            # Deleting the fields one by one would write the databag once per field
+            self.data_interface.delete_relation_data(self.relation.id, delete_fields)
+        else:
+            for field in delete_fields:
+                del self.relation_data[field]
@@ -15,7 +15,7 @@
 r"""A library for creating service accounts that are configured to run Spark jobs."""
 import json
 import logging
-from collections import namedtuple
+from dataclasses import dataclass
 from typing import List, Optional, Union
 
 from charms.data_platform_libs.v0.data_interfaces import (
@@ -44,21 +44,34 @@ LIBAPI = 0
 
 # Increment this PATCH version before using `charmcraft publish-lib` or reset
 # to 0 if you are raising the major API version
-LIBPATCH = 1
+LIBPATCH = 2
 
 
 logger = logging.getLogger(__name__)
 
-Diff = namedtuple("Diff", "added changed deleted")
-Diff.__doc__ = """
-A tuple for storing the diff between two data mappings.
+# Canonical and compact serialization of the data snapshot stored by diff(). json.dumps would
+# build a new encoder on each call when given options, so a single instance is shared.
+DATA_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
 
-added - keys that were added
-changed - keys that still exist but have new values
-deleted - key that were deleted"""
+# Fields whose addition to the provider databag means that the service account was granted
+GRANTED_ACCOUNT_FIELDS = frozenset({"service-account", "namespace"})
 
 
-def diff(event: RelationChangedEvent, bucket: Union[Unit, Application]) -> Diff:
+@dataclass(frozen=True, slots=True)
+class Diff:
+    """The diff between two data mappings.
+
+    added - keys that were added
+    changed - keys that still exist but have new values
+    deleted - key that were deleted
+    """
+
+    added: set[str]
+    changed: set[str]
+    deleted: set[str]
+
+
+def diff(event: RelationChangedEvent, bucket: Optional[Union[Unit, Application]]) -> Diff:
     """Retrieves the diff of the data in the relation changed databag.
 
     Args:
@@ -69,27 +82,37 @@ def diff(event: RelationChangedEvent, bucket: Union[Unit, Application]) -> Diff:
         a Diff instance containing the added, deleted and changed
             keys from the event relation databag.
     """
+    if not bucket:
+        return Diff(set(), set(), set())
+
     # Retrieve the old data from the data key in the application relation databag.
     old_data = json.loads(event.relation.data[bucket].get("data", "{}"))
+    if not event.app:
+        # Without a remote application all the previous keys are deleted, and the
+        # snapshot only needs to be emptied if it was not already.
+        if old_data:
+            event.relation.data[bucket].update({"data": DATA_ENCODER.encode({})})
+        return Diff(set(), set(), set(old_data))
+
     # Retrieve the new data from the event relation databag.
-    new_data = (
-        {key: value for key, value in event.relation.data[event.app].items() if key != "data"}
-        if event.app
-        else {}
-    )
+    new_data = dict(event.relation.data[event.app])
+    new_data.pop("data", None)
 
     # These are the keys that were added to the databag and triggered this event.
     added = new_data.keys() - old_data.keys()
     # These are the keys that were removed from the databag and triggered this event.
     deleted = old_data.keys() - new_data.keys()
     # These are the keys that already existed in the databag,
-    # but had their values changed.
-    changed = {key for key in old_data.keys() & new_data.keys() if old_data[key] != new_data[key]}
+    # but had their values changed. The databag values are strings, hence hashable, so
+    # the items views can be subtracted as sets.
+    changed = {key for key, _ in new_data.items() - old_data.items()} - added
 
     # TODO: evaluate the possibility of losing the diff if some error
     # happens in the charm before the diff is completely checked (DPE-412).
     # Convert the new_data to a serializable format and save it for a next diff check.
-    event.relation.data[bucket].update({"data": json.dumps(new_data)})
+    # An empty diff means the stored data is already up to date, so the write is skipped.
+    if added or changed or deleted:
+        event.relation.data[bucket].update({"data": DATA_ENCODER.encode(new_data)})
 
     # Return the diff with all possible changes.
     return Diff(added, changed, deleted)
@@ -187,6 +210,10 @@ class IntegrationHubProviderEventHandlers(EventHandlers):
             self._on_relation_departed,
         )
 
+    def _diff(self, event: RelationChangedEvent) -> Diff:
+        """Retrieves the diff of the data in the relation changed databag."""
+        return diff(event, self.relation_data.data_component)
+
     def _on_relation_changed_event(self, event: RelationChangedEvent) -> None:
         """Event emitted when the relation has changed."""
         # Leader only
@@ -196,7 +223,7 @@ class IntegrationHubProviderEventHandlers(EventHandlers):
         diff = self._diff(event)
         # emit on account requested if service account name is provided by the requirer application
         if "service-account" in diff.added and "namespace" in diff.added:
-            getattr(self.on, "account_requested").emit(
+            self.on.account_requested.emit(  # pyright: ignore [reportAttributeAccessIssue]
                 event.relation, app=event.app, unit=event.unit
             )
 
@@ -206,7 +233,9 @@ class IntegrationHubProviderEventHandlers(EventHandlers):
         if not self.relation_data.local_unit.is_leader():
             return
 
-        getattr(self.on, "account_released").emit(event.relation, app=event.app, unit=event.unit)
+        self.on.account_released.emit(  # pyright: ignore [reportAttributeAccessIssue]
+            event.relation, app=event.app, unit=event.unit
+        )
 
 
 class IntegrationHubProvider(IntegrationHubProviderData, IntegrationHubProviderEventHandlers):
@@ -226,12 +255,17 @@ class IntegrationHubRequirerData(RequirerData):
         relation_name: str,
         service_account: str,
         namespace: str,
-        additional_secret_fields: Optional[List[str]] = [],
+        additional_secret_fields: Optional[List[str]] = None,
     ):
         """Manager of Integration Hub relations."""
         super().__init__(model, relation_name, additional_secret_fields=additional_secret_fields)
         self.service_account = service_account
         self.namespace = namespace
+        # Names of the fields holding the secrets, which do not change over time
+        self.secret_field_user = self._generate_secret_field_name(SECRET_GROUPS.USER)
+        self.secret_field_names = frozenset(
+            self._generate_secret_field_name(group) for group in SECRET_GROUPS.groups()
+        )
 
     @property
     def service_account(self):
@@ -275,8 +309,8 @@ class IntegrationHubRequirerEventHandlers(RequirerEventHandlers):
 
         # Sets service_account, namespace in the relation
         relation_data = {
-            f: getattr(self.relation_data, f.replace("-", "_"), "")
-            for f in ["service-account", "namespace"]
+            "service-account": self.relation_data.service_account,
+            "namespace": self.relation_data.namespace,
         }
 
         self.relation_data.update_relation_data(event.relation.id, relation_data)
@@ -285,6 +319,10 @@ class IntegrationHubRequirerEventHandlers(RequirerEventHandlers):
         """Event notifying about a new value of a secret."""
         pass
 
+    def _diff(self, event: RelationChangedEvent) -> Diff:
+        """Retrieves the diff of the data in the relation changed databag."""
+        return diff(event, self.relation_data.data_component)
+
     def _on_relation_changed_event(self, event: RelationChangedEvent) -> None:
         """Event emitted when the Integration Hub relation has changed."""
         logger.info("On Integration Hub relation changed")
@@ -293,23 +331,25 @@ class IntegrationHubRequirerEventHandlers(RequirerEventHandlers):
 
         # Check if the service-account is created in the desired namespace
 
-        # Register all new secrets with their labels
-        if any(newval for newval in diff.added if self.relation_data._is_secret_field(newval)):
+        # Register all new secrets with their labels. Only the fields of the known secret
+        # groups are registered, so there is nothing to do if none of them was added.
+        if not diff.added.isdisjoint(self.relation_data.secret_field_names):
             self.relation_data._register_secrets_to_relation(event.relation, diff.added)
 
-        secret_field_user = self.relation_data._generate_secret_field_name(SECRET_GROUPS.USER)
-
         if (
-            "service-account" in diff.added and "namespace" in diff.added
-        ) or secret_field_user in diff.added:
-            getattr(self.on, "account_granted").emit(
+            GRANTED_ACCOUNT_FIELDS <= diff.added
+            or self.relation_data.secret_field_user in diff.added
+        ):
+            self.on.account_granted.emit(  # pyright: ignore [reportAttributeAccessIssue]
                 event.relation, app=event.app, unit=event.unit
             )
 
     def _on_relation_broken(self, event: RelationBrokenEvent) -> None:
         """Notify the charm about a broken service account relation."""
         logger.info("On Integration Hub relation gone")
-        getattr(self.on, "account_gone").emit(event.relation, app=event.app, unit=event.unit)
+        self.on.account_gone.emit(  # pyright: ignore [reportAttributeAccessIssue]
+            event.relation, app=event.app, unit=event.unit
+        )
 
 
 class IntegrationHubRequirer(IntegrationHubRequirerData, IntegrationHubRequirerEventHandlers):
@@ -321,7 +361,7 @@ class IntegrationHubRequirer(IntegrationHubRequirerData, IntegrationHubRequirerE
         relation_name: str,
         service_account: str,
         namespace: str,
-        additional_secret_fields: Optional[List[str]] = [],
+        additional_secret_fields: Optional[List[str]] = None,
     ) -> None:
         IntegrationHubRequirerData.__init__(
             self,
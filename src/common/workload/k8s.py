@@ -8,7 +8,7 @@ import logging
 from abc import ABC
 
 from ops import Container
-from ops.pebble import ExecError
+from ops.pebble import ExecError, PathError
 from typing_extensions import override
 
 from common.workload import AbstractWorkload
@@ -42,11 +42,14 @@ class K8sWorkload(AbstractWorkload, ABC):
         Raises:
             FileNotFound if the file does not exist
         """
-        if not self.container.exists(path):
-            raise FileNotFoundError
-
-        with self.container.pull(path) as f:
-            return f.read()
+        try:
+            with self.container.pull(path) as f:
+                return f.read()
+        except PathError as e:
+            # Checking for existence first would cost an extra round-trip to Pebble
+            if e.kind == "not-found":
+                raise FileNotFoundError(path) from e
+            raise
 
     @override
     def write(self, content: str, path: str, mode: str = "w") -> None:
@@ -57,8 +60,13 @@ class K8sWorkload(AbstractWorkload, ABC):
             path: the full filepath to write to
             mode: the write mode. Usually "w" for write, or "a" for append. Default "w"
         """
-        if mode == "a" and (current := self.read(path)):
-            content = current + "\n" + content
+        if mode == "a":
+            try:
+                current = self.read(path)
+            except FileNotFoundError:
+                current = ""
+            if current:
+                content = current + "\n" + content
         self.container.push(path, content, make_dirs=True)
 
     @override
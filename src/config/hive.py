@@ -5,6 +5,7 @@
 
 """Hive related configurations."""
 
+from functools import cached_property
 from typing import Optional
 from xml.etree import ElementTree
 
@@ -14,9 +15,17 @@ from constants import (
 from core.domain import DatabaseConnectionInfo
 from utils.logging import WithLogging
 
+XML_HEADER = '<?xml version="1.0"?>'
+
+# hive-site.xml rendered when no metastore database is related
+EMPTY_HIVE_SITE = f"{XML_HEADER}\n<configuration />\n"
+
 
 class HiveConfig(WithLogging):
-    """Hive Configuration."""
+    """Hive Configuration.
+
+    The rendered sections are cached, so a new object must be created when the inputs change.
+    """
 
     def __init__(self, db_info: Optional[DatabaseConnectionInfo]):
         self.db_info = db_info
@@ -27,7 +36,7 @@ class HiveConfig(WithLogging):
             f"jdbc:postgresql://{endpoint}/{METASTORE_DATABASE_NAME}?createDatabaseIfNotExist=true"
         )
 
-    @property
+    @cached_property
     def _db_conf(self) -> dict[str, str]:
         """Return a dictionary representation of hive configuration."""
         if not self.db_info:
@@ -48,10 +57,12 @@ class HiveConfig(WithLogging):
         """Return the dict representation of the configuration file."""
         return self._db_conf
 
-    @property
+    @cached_property
     def contents(self) -> str:
         """Return configuration contents formatted to be saved in hive-site.xml."""
-        header = '<?xml version="1.0"?>'
+        if not self.db_info:
+            return EMPTY_HIVE_SITE
+
         root = ElementTree.Element("configuration")
         for name, value in self.to_dict().items():
             prop = ElementTree.SubElement(root, "property")
@@ -61,4 +72,4 @@ class HiveConfig(WithLogging):
             value_element.text = value
         body = ElementTree.tostring(root, encoding="unicode")
 
-        return f"{header}\n{body}\n"
+        return f"{XML_HEADER}\n{body}\n"
@@ -5,15 +5,24 @@
 
 """Kyuubi workload configurations."""
 
+from functools import cached_property
 from typing import Optional
 
 from constants import AUTHENTICATION_TABLE_NAME
 from core.domain import DatabaseConnectionInfo, ZookeeperInfo
 from utils.logging import WithLogging
 
+# Query run by Kyuubi to authenticate users, with its ${user} and ${password} placeholders
+AUTHENTICATION_QUERY = (
+    f"SELECT 1 FROM {AUTHENTICATION_TABLE_NAME} WHERE username=${{user}} AND passwd=${{password}}"
+)
+
 
 class KyuubiConfig(WithLogging):
-    """Kyuubi Configurations."""
+    """Kyuubi Configurations.
+
+    The rendered sections are cached, so a new object must be created when the inputs change.
+    """
 
     def __init__(
         self,
@@ -27,12 +36,6 @@ class KyuubiConfig(WithLogging):
         endpoint = self.db_info.endpoint
         return f"jdbc:postgresql://{endpoint}/{self.db_info.dbname}"
 
-    def _get_authentication_query(self) -> str:
-        return (
-            f"SELECT 1 FROM {AUTHENTICATION_TABLE_NAME} "
-            "WHERE username=${user} AND passwd=${password}"
-        )
-
     def _get_zookeeper_auth_digest(self) -> str:
         """Return auth digest string to connect to ZooKeeper."""
         if not self.zookeeper_info:
@@ -41,7 +44,7 @@ class KyuubiConfig(WithLogging):
         password = self.zookeeper_info.password
         return f"{username}:{password}"
 
-    @property
+    @cached_property
     def _auth_conf(self) -> dict[str, str]:
         if not self.db_info:
             return {}
@@ -51,10 +54,10 @@ class KyuubiConfig(WithLogging):
             "kyuubi.authentication.jdbc.url": self._get_db_connection_url(),
             "kyuubi.authentication.jdbc.user": self.db_info.username,
             "kyuubi.authentication.jdbc.password": self.db_info.password,
-            "kyuubi.authentication.jdbc.query": self._get_authentication_query(),
+            "kyuubi.authentication.jdbc.query": AUTHENTICATION_QUERY,
         }
 
-    @property
+    @cached_property
     def _ha_conf(self) -> dict[str, str]:
         if not self.zookeeper_info:
             return {}
@@ -69,15 +72,12 @@ class KyuubiConfig(WithLogging):
         """Return the dict representation of the configuration file."""
         return self._auth_conf | self._ha_conf
 
-    @property
+    @cached_property
     def contents(self) -> str:
         """Return configuration contents formatted to be consumed by pebble layer."""
-        dict_content = self.to_dict()
-
+        # Nothing is rendered without any source of configuration
+        if self.db_info is None and self.zookeeper_info is None:
+            return ""
         return "\n".join(
-            [
-                f"{key}={value}"
-                for key in sorted(dict_content.keys())
-                if (value := dict_content[key])
-            ]
+            [f"{key}={value}" for key, value in sorted(self.to_dict().items()) if value]
         )
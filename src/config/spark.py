@@ -5,16 +5,29 @@
 
 """Spark related configurations."""
 
+import functools
 from typing import Optional
 
-from lightkube import Client
 from lightkube.core.exceptions import ApiError
-from spark8t.services import K8sServiceAccountRegistry, LightKube
 
 from constants import KYUUBI_OCI_IMAGE
 from core.domain import S3ConnectionInfo, SparkServiceAccountInfo
+from managers.k8s import get_service_account, get_spark_master
 from utils.logging import WithLogging
 
+# Base configurations that do not depend on the K8s cluster
+SPARK_STATIC_CONF = {
+    "spark.kubernetes.container.image": KYUUBI_OCI_IMAGE,
+    "spark.submit.deployMode": "cluster",
+}
+
+# S3A configurations that do not depend on the S3 relation data
+S3A_STATIC_CONF = {
+    "spark.hadoop.fs.s3a.aws.credentials.provider": "org.apache.hadoop.fs.s3a.SimpleAWSCredentialsProvider",
+    "spark.hadoop.fs.s3a.connection.ssl.enabled": "false",
+    "spark.hadoop.fs.s3a.path.style.access": "true",
+}
+
 
 class SparkConfig(WithLogging):
     """Spark Configurations."""
@@ -37,32 +50,23 @@ class SparkConfig(WithLogging):
         return f"s3a://{bucket_name}/{warehouse_dir}"
 
     def _get_spark_master(self) -> str:
-        cluster_address = Client().config.cluster.server
-        return f"k8s://{cluster_address}"
+        return get_spark_master()
 
     def _base_conf(self):
         """Return base Spark configurations."""
-        return {
-            "spark.master": self._get_spark_master(),
-            "spark.kubernetes.container.image": KYUUBI_OCI_IMAGE,
-            "spark.submit.deployMode": "cluster",
-        }
+        return {"spark.master": self._get_spark_master(), **SPARK_STATIC_CONF}
 
     def _sa_conf(self):
         """Spark configurations read from Spark8t."""
         if not self.service_account_info:
             return {}
 
-        interface = LightKube(None, None)
-        registry = K8sServiceAccountRegistry(interface)
-
         account_id = ":".join(
             [self.service_account_info.namespace, self.service_account_info.service_account]
         )
 
         try:
-            service_account = registry.get(account_id)
-            return service_account.configurations.props
+            return get_service_account(account_id).configurations.props
         except (ApiError, AttributeError):
             self.logger.warning(f"Could not fetch Spark properties from {account_id}.")
 
@@ -70,21 +74,16 @@ class SparkConfig(WithLogging):
 
     def _user_conf(self):
         """Spark configurations generated from relations."""
-        conf = {}
-        if self.s3_info:
-            conf.update(
-                {
-                    "spark.hadoop.fs.s3a.endpoint": self.s3_info.endpoint,
-                    "spark.hadoop.fs.s3a.access.key": self.s3_info.access_key,
-                    "spark.hadoop.fs.s3a.secret.key": self.s3_info.secret_key,
-                    "spark.hadoop.fs.s3a.aws.credentials.provider": "org.apache.hadoop.fs.s3a.SimpleAWSCredentialsProvider",
-                    "spark.hadoop.fs.s3a.connection.ssl.enabled": "false",
-                    "spark.hadoop.fs.s3a.path.style.access": "true",
-                    "spark.sql.warehouse.dir": self._get_sql_warehouse_path(),
-                    "spark.kubernetes.file.upload.path": self._get_upload_path(),
-                }
-            )
-        return conf
+        if not self.s3_info:
+            return {}
+        return {
+            "spark.hadoop.fs.s3a.endpoint": self.s3_info.endpoint,
+            "spark.hadoop.fs.s3a.access.key": self.s3_info.access_key,
+            "spark.hadoop.fs.s3a.secret.key": self.s3_info.secret_key,
+            **S3A_STATIC_CONF,
+            "spark.sql.warehouse.dir": self._get_sql_warehouse_path(),
+            "spark.kubernetes.file.upload.path": self._get_upload_path(),
+        }
 
     def to_dict(self) -> dict[str, str]:
         """Return the dict representation of the configuration file.
@@ -94,17 +93,11 @@ class SparkConfig(WithLogging):
             2. Configurations associated with service account read from Spark8t
             3. Base configurations
         """
-        return self._base_conf() | self._sa_conf() | self._user_conf()
+        return {**self._base_conf(), **self._sa_conf(), **self._user_conf()}
 
-    @property
+    @functools.cached_property
     def contents(self) -> str:
         """Return configuration contents formatted to be consumed by pebble layer."""
-        dict_content = self.to_dict()
-
         return "\n".join(
-            [
-                f"{key}={value}"
-                for key in sorted(dict_content.keys())
-                if (value := dict_content[key])
-            ]
+            [f"{key}={value}" for key, value in sorted(self.to_dict().items()) if value]
         )
@@ -4,6 +4,9 @@
 
 """Charm Context definition and parsing logic."""
 
+from functools import cached_property
+from typing import Any, MutableMapping
+
 from charms.data_platform_libs.v0.data_interfaces import DatabaseRequirerData
 from ops import Model, Relation
 
@@ -27,13 +30,23 @@ from core.domain import (
 )
 from utils.logging import WithLogging
 
+# Fields that a database relation must provide for the connection to be usable
+DATABASE_FIELDS = frozenset({"endpoints", "username", "password"})
+
 
 class Context(WithLogging):
     """Properties and relations of the charm."""
 
-    def __init__(self, model: Model, config: CharmConfig):
+    def __init__(
+        self,
+        model: Model,
+        config: CharmConfig,
+        s3_verification: MutableMapping[str, Any],
+    ):
         self.model = model
         self.config = config
+        # Last successful S3 credentials verification, persisted across hooks
+        self.s3_verification = s3_verification
         self.metastore_db_requirer = DatabaseRequirerData(
             self.model, POSTGRESQL_METASTORE_DB_REL, database_name=METASTORE_DATABASE_NAME
         )
@@ -48,6 +61,10 @@ class Context(WithLogging):
             ZOOKEEPER_REL,
             database_name=HA_ZNODE_NAME,
         )
+        # Whether the charm statuses need to be recomputed at the end of the hook
+        self.status_outdated = False
+        # Outcome of the S3 credentials verification, once it has been made in this hook
+        self.s3_verified: bool | None = None
 
     @property
     def _s3_relation(self) -> Relation | None:
@@ -64,18 +81,26 @@ class Context(WithLogging):
         """The zookeeper relation."""
         return self.model.get_relation(ZOOKEEPER_REL)
 
+    @cached_property
+    def planned_units(self) -> int:
+        """The number of units planned for the application, as reported by Juju goal-state."""
+        return self.model.app.planned_units()
+
     # --- DOMAIN OBJECTS ---
 
-    @property
+    # The Context is created for every hook and the remote relation data does not change
+    # during a hook, so the domain objects that need to fetch it are cached.
+
+    @cached_property
     def s3(self) -> S3ConnectionInfo | None:
         """The state of S3 connection."""
         return S3ConnectionInfo(rel, rel.app) if (rel := self._s3_relation) else None
 
-    @property
+    @cached_property
     def metastore_db(self) -> DatabaseConnectionInfo | None:
         """The state of metastore DB connection."""
         for data in self.metastore_db_requirer.fetch_relation_data().values():
-            if any(key not in data for key in ["endpoints", "username", "password"]):
+            if not DATABASE_FIELDS <= data.keys():
                 continue
             return DatabaseConnectionInfo(
                 endpoint=data["endpoints"],
@@ -85,11 +110,11 @@ class Context(WithLogging):
             )
         return None
 
-    @property
+    @cached_property
     def auth_db(self) -> DatabaseConnectionInfo | None:
         """The state of authentication DB connection."""
         for data in self.auth_db_requirer.fetch_relation_data().values():
-            if any(key not in data for key in ["endpoints", "username", "password"]):
+            if not DATABASE_FIELDS <= data.keys():
                 continue
             return DatabaseConnectionInfo(
                 endpoint=data["endpoints"],
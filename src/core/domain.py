@@ -8,6 +8,7 @@
 import json
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 from typing import List, MutableMapping
 
 from charms.data_platform_libs.v0.data_interfaces import Data
@@ -84,6 +85,11 @@ class S3ConnectionInfo(StateBase):
     def __init__(self, relation: Relation, component: Application):
         super().__init__(relation, component)
 
+    @cached_property
+    def relation_data(self) -> MutableMapping[str, str]:
+        """The raw relation data, looked up once for all the fields read from it."""
+        return super().relation_data
+
     @property
     def endpoint(self) -> str | None:
         """Return endpoint of the S3 bucket."""
@@ -137,6 +143,8 @@ class DatabaseConnectionInfo:
 class SparkServiceAccountInfo(RelationState):
     """Requirer-side of the Integration Hub relation."""
 
+    __slots__ = ("app",)
+
     def __init__(
         self,
         relation: Relation | None,
@@ -165,6 +173,8 @@ class SparkServiceAccountInfo(RelationState):
 class ZookeeperInfo(RelationState):
     """State collection metadata for a the Zookeeper relation."""
 
+    __slots__ = ("_local_app",)
+
     def __init__(
         self,
         relation: Relation | None,
@@ -251,10 +261,8 @@ class ZookeeperInfo(RelationState):
             True if ZooKeeper is currently related with sufficient relation data
                 for a broker to connect with. Otherwise False
         """
-        if not all([self.username, self.password, self.database, self.uris]):
-            return False
-
-        return True
+        # Each field is fetched from the relation, so stop at the first missing one
+        return bool(self.username and self.password and self.database and self.uris)
 
     def __bool__(self) -> bool:
         """Return whether this class object has sufficient information."""
@@ -18,6 +18,10 @@ class KyuubiWorkloadBase(AbstractWorkload):
     KYUUBI_ROOT = "/opt/kyuubi"
     KYUUBI_LOGS = KYUUBI_ROOT + "/logs"
     KYUUBI_VERSION_FILE = KYUUBI_ROOT + "/RELEASE"
+    CONFIGURATION_DIGEST_FILE = KYUUBI_ROOT + "/conf/.charm-configuration-digest"
+
+    # Content of CONFIGURATION_DIGEST_FILE, once read or written during the hook
+    configuration_digest: str | None
 
     def restart(self) -> None:
         """Restarts the workload service."""
@@ -18,6 +18,8 @@ from core.domain import User
 from core.workload import KyuubiWorkloadBase
 from utils.logging import WithLogging
 
+KYUUBI_VERSION_PATTERN = re.compile(r"Kyuubi (?P<version>[\d\.]+)")
+
 
 class KyuubiWorkload(KyuubiWorkloadBase, K8sWorkload, WithLogging):
     """Class representing workload implementation for Kyuubi on K8s."""
@@ -25,6 +27,7 @@ class KyuubiWorkload(KyuubiWorkloadBase, K8sWorkload, WithLogging):
     def __init__(self, container: Container, user: User = User()):
         self.container = container
         self.user = user
+        self.configuration_digest = None
 
     @property
     def _kyuubi_server_layer(self):
@@ -78,9 +81,5 @@ class KyuubiWorkload(KyuubiWorkloadBase, K8sWorkload, WithLogging):
     @property
     def kyuubi_version(self):
         """Return the version of Kyuubi."""
-        version_pattern = r"Kyuubi (?P<version>[\d\.]+)"
-        for line in self.read(self.KYUUBI_VERSION_FILE).splitlines():
-            version = re.search(version_pattern, line)
-            if version:
-                return version.group("version")
-        return ""
+        version = KYUUBI_VERSION_PATTERN.search(self.read(self.KYUUBI_VERSION_FILE))
+        return version.group("version") if version else ""
@@ -4,6 +4,8 @@
 
 """Action related event handlers."""
 
+from functools import cached_property
+
 from charms.data_platform_libs.v0.data_models import TypedCharmBase
 from ops.charm import ActionEvent
 
@@ -14,7 +16,6 @@ from core.workload import KyuubiWorkloadBase
 from events.base import BaseEventHandler
 from managers.auth import AuthenticationManager
 from managers.kyuubi import KyuubiManager
-from managers.service import ServiceManager
 from utils.logging import WithLogging
 
 
@@ -29,17 +30,16 @@ class ActionEvents(BaseEventHandler, WithLogging):
         self.workload = workload
 
         self.kyuubi = KyuubiManager(self.workload, self.context)
-        self.auth = AuthenticationManager(self.context.auth_db)
-        self.service_manager = ServiceManager(
-            namespace=self.charm.model.name,
-            unit_name=self.charm.unit.name,
-            app_name=self.charm.app.name,
-        )
 
         self.framework.observe(self.charm.on.get_jdbc_endpoint_action, self._on_get_jdbc_endpoint)
         self.framework.observe(self.charm.on.get_password_action, self._on_get_password)
         self.framework.observe(self.charm.on.set_password_action, self._on_set_password)
 
+    @cached_property
+    def auth(self) -> AuthenticationManager:
+        """The authentication manager, only built by the password actions that need it."""
+        return AuthenticationManager(self.context.auth_db)
+
     def _on_get_jdbc_endpoint(self, event: ActionEvent):
         """Action event handler that returns back with a JDBC endpoint."""
         if not self.workload.ready():
@@ -50,7 +50,7 @@ class ActionEvents(BaseEventHandler, WithLogging):
             return
 
         address = self.service_manager.get_service_endpoint(
-            expose_external=self.charm.config.expose_external
+            expose_external=self.context.config.expose_external
         )
         if not address:
             event.fail(
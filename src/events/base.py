@@ -26,6 +26,17 @@ class BaseEventHandler(Object, WithLogging):
     charm: TypedCharmBase
     context: Context
 
+    @property
+    def service_manager(self) -> ServiceManager:
+        """The manager of the Kyuubi K8s service."""
+        return self.charm.service_manager  # type: ignore
+
+    @property
+    def refresh_failed(self) -> bool:
+        """Return whether the refresh of this unit has failed and is waiting for a rollback."""
+        upgrade_events = getattr(self.charm, "upgrade_events", None)
+        return upgrade_events is not None and upgrade_events.state == "failed"
+
     def get_app_status(  # noqa: C901
         self,
     ) -> StatusBase:
@@ -34,16 +45,20 @@ class BaseEventHandler(Object, WithLogging):
             return Status.WAITING_PEBBLE.value
 
         if self.context.s3:
-            s3_manager = S3Manager(s3_info=self.context.s3)
-            if not s3_manager.verify():
+            if self.context.s3_verified is None:
+                s3_manager = S3Manager(s3_info=self.context.s3)
+                self.context.s3_verified = s3_manager.verify(state=self.context.s3_verification)
+            if not self.context.s3_verified:
                 return Status.INVALID_CREDENTIALS.value
 
-        if not self.context.service_account:
+        # Each of these reads and parses the relation data, so they are only read once
+        service_account = self.context.service_account
+        zookeeper = self.context.zookeeper
+
+        if not service_account:
             return Status.MISSING_INTEGRATION_HUB.value
 
-        k8s_manager = K8sManager(
-            service_account_info=self.context.service_account, workload=self.workload
-        )
+        k8s_manager = K8sManager(service_account_info=service_account, workload=self.workload)
 
         if not k8s_manager.has_cluster_permissions():
             return Status.INSUFFICIENT_CLUSTER_PERMISSIONS.value
@@ -64,20 +79,16 @@ class BaseEventHandler(Object, WithLogging):
         if not k8s_manager.is_service_account_valid():
             return Status.INVALID_SERVICE_ACCOUNT.value
 
-        if self.context._zookeeper_relation and not self.context.zookeeper:
+        # The Zookeeper information is None when the relation does not exist
+        zookeeper_ready = bool(zookeeper)
+        if zookeeper is not None and not zookeeper_ready:
             return Status.WAITING_ZOOKEEPER.value
 
-        if self.charm.app.planned_units() > 1 and not self.context.zookeeper:
+        if self.context.planned_units > 1 and not zookeeper_ready:
             return Status.MISSING_ZOOKEEPER.value
 
-        service_manager = ServiceManager(
-            namespace=self.charm.model.name,
-            unit_name=self.charm.unit.name,
-            app_name=self.charm.app.name,
-        )
-
-        if not service_manager.get_service_endpoint(
-            expose_external=self.charm.config.expose_external
+        if not self.service_manager.get_service_endpoint(
+            expose_external=self.context.config.expose_external
         ):
             return Status.WAITING_FOR_SERVICE.value
 
@@ -87,15 +98,17 @@ class BaseEventHandler(Object, WithLogging):
 def compute_status(
     hook: Callable[[BaseEventHandler, EventBase], None]
 ) -> Callable[[BaseEventHandler, EventBase], None]:
-    """Decorator to automatically compute statuses at the end of the hook."""
+    """Decorator to automatically compute statuses at the end of the hook.
+
+    The statuses are evaluated only once per hook, when the collect-status events are
+    emitted, however many decorated handlers have run during the hook.
+    """
 
     @wraps(hook)
     def wrapper_hook(event_handler: BaseEventHandler, event: EventBase):
-        """Return output after resetting statuses."""
+        """Return output after marking statuses to be recomputed."""
         res = hook(event_handler, event)
-        if event_handler.charm.unit.is_leader():
-            event_handler.charm.app.status = event_handler.get_app_status()
-        event_handler.charm.unit.status = event_handler.get_app_status()
+        event_handler.context.status_outdated = True
         return res
 
     return wrapper_hook
@@ -33,8 +33,8 @@ class SparkIntegrationHubEvents(BaseEventHandler, WithLogging):
 
         self.kyuubi = KyuubiManager(self.workload, self.context)
 
-        namespace = self.charm.config.namespace
-        service_account = self.charm.config.service_account
+        namespace = self.context.config.namespace
+        service_account = self.context.config.service_account
 
         self.requirer = IntegrationHubRequirer(
             self.charm,
@@ -4,6 +4,8 @@
 
 """Kyuubi related event handlers."""
 
+from functools import cached_property
+
 import ops
 from charms.data_platform_libs.v0.data_models import TypedCharmBase
 
@@ -12,7 +14,6 @@ from core.context import Context
 from core.workload import KyuubiWorkloadBase
 from events.base import BaseEventHandler, compute_status, defer_when_not_ready
 from managers.kyuubi import KyuubiManager
-from managers.service import ServiceManager
 from providers import KyuubiClientProvider
 from utils.logging import WithLogging
 
@@ -29,16 +30,13 @@ class KyuubiEvents(BaseEventHandler, WithLogging):
 
         self.kyuubi = KyuubiManager(self.workload, self.context)
         self.kyuubi_client = KyuubiClientProvider(self.charm, KYUUBI_CLIENT_RELATION_NAME)
-        self.service_manager = ServiceManager(
-            namespace=self.charm.model.name,
-            unit_name=self.charm.unit.name,
-            app_name=self.charm.app.name,
-        )
 
         self.framework.observe(self.charm.on.install, self._on_install)
         self.framework.observe(self.charm.on.kyuubi_pebble_ready, self._on_kyuubi_pebble_ready)
         self.framework.observe(self.charm.on.update_status, self._update_event)
         self.framework.observe(self.charm.on.config_changed, self._on_config_changed)
+        self.framework.observe(self.charm.on.collect_app_status, self._on_collect_app_status)
+        self.framework.observe(self.charm.on.collect_unit_status, self._on_collect_unit_status)
 
         # Peer relation events
         self.framework.observe(
@@ -48,6 +46,22 @@ class KyuubiEvents(BaseEventHandler, WithLogging):
             self.charm.on[PEER_REL].relation_departed, self._on_peer_relation_departed
         )
 
+    @cached_property
+    def _status(self) -> ops.StatusBase:
+        """The status of the charm, shared by the unit and the app."""
+        return self.get_app_status()
+
+    def _on_collect_app_status(self, event: ops.CollectStatusEvent) -> None:
+        """Set the app status, if any handler of the hook requested it."""
+        if self.context.status_outdated:
+            event.add_status(self._status)
+
+    def _on_collect_unit_status(self, event: ops.CollectStatusEvent) -> None:
+        """Set the unit status, if any handler of the hook requested it."""
+        # The unit status set by a failed refresh takes precedence until it is rolled back
+        if self.context.status_outdated and not self.refresh_failed:
+            event.add_status(self._status)
+
     @compute_status
     def _on_install(self, event: ops.InstallEvent) -> None:
         """Handle the `on_install` event."""
@@ -58,13 +72,13 @@ class KyuubiEvents(BaseEventHandler, WithLogging):
         """Handle the on_config_changed event."""
         if self.charm.unit.is_leader():
             # Create / update the managed service to reflect the service type in config
-            self.service_manager.reconcile_services(self.charm.config.expose_external)
+            self.service_manager.reconcile_services(self.context.config.expose_external)
 
         self.kyuubi.update()
 
         # Check the newly created service is connectable
         if not self.service_manager.get_service_endpoint(
-            expose_external=self.charm.config.expose_external
+            expose_external=self.context.config.expose_external
         ):
             self.logger.info(
                 "Managed K8s service is not available yet; deferring config-changed event now..."
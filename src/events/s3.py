@@ -42,11 +42,13 @@ class S3Events(BaseEventHandler, WithLogging):
     def _on_s3_credential_changed(self, _: CredentialsChangedEvent):
         """Handle the `CredentialsChangedEvent` event from S3 integrator."""
         self.logger.info("S3 Credentials changed")
+        self.context.s3_verification.clear()
         self.kyuubi.update()
 
     @compute_status
     def _on_s3_credential_gone(self, _: CredentialsGoneEvent):
         """Handle the `CredentialsGoneEvent` event for S3 integrator."""
         self.logger.info("S3 Credentials gone")
+        self.context.s3_verification.clear()
         self.logger.info(self.context.s3)
         self.kyuubi.update(set_s3_none=True)
@@ -11,7 +11,6 @@ from charms.data_platform_libs.v0.upgrade import (
     EventBase,
     KubernetesClientError,
 )
-from lightkube.core.client import Client
 from lightkube.core.exceptions import ApiError
 from lightkube.resources.apps_v1 import StatefulSet
 from ops import CharmBase, ModelError
@@ -23,6 +22,7 @@ from constants import KYUUBI_CONTAINER_NAME
 from core.context import Context
 from core.workload import KyuubiWorkloadBase
 from events.base import BaseEventHandler
+from managers.k8s import get_lightkube_client
 from managers.kyuubi import KyuubiManager
 
 
@@ -119,7 +119,7 @@ class UpgradeEvents(DataUpgrade, BaseEventHandler):
         """Set the rolling update partition to a specific value."""
         try:
             patch = {"spec": {"updateStrategy": {"rollingUpdate": {"partition": partition}}}}
-            Client().patch(  # pyright: ignore [reportArgumentType]
+            get_lightkube_client().patch(  # pyright: ignore [reportArgumentType]
                 StatefulSet,
                 name=self.charm.model.app.name,
                 namespace=self.charm.model.name,
@@ -12,7 +12,7 @@ from constants import (
     POSTGRESQL_DEFAULT_DATABASE,
 )
 from core.domain import DatabaseConnectionInfo
-from managers.database import DatabaseManager
+from managers.database import DatabaseManager, import_psycopg2
 from utils.logging import WithLogging
 
 
@@ -22,22 +22,29 @@ class AuthenticationManager(WithLogging):
     DEFAULT_ADMIN_USERNAME = "admin"
     AUTHENTICATION_TABLE_NAME = "kyuubi_users"
 
+    CREATE_TABLE_QUERY = f"""
+        CREATE TABLE IF NOT EXISTS {AUTHENTICATION_TABLE_NAME} (
+            id SERIAL PRIMARY KEY,
+            username VARCHAR(100) UNIQUE NOT NULL,
+            passwd VARCHAR(255) NOT NULL
+        );
+    """
+
+    # Parameterized queries for the writes on the authentication table
+    INSERT_USER_QUERY = (
+        f"INSERT INTO {AUTHENTICATION_TABLE_NAME} (username, passwd) VALUES (%s, %s) "
+        "ON CONFLICT (username) DO NOTHING RETURNING username;"
+    )
+    DELETE_USER_QUERY = f"DELETE FROM {AUTHENTICATION_TABLE_NAME} WHERE username = %s;"
+    UPDATE_PASSWORD_QUERY = (
+        f"UPDATE {AUTHENTICATION_TABLE_NAME} SET passwd = %s WHERE username = %s;"
+    )
+
     def __init__(self, db_info: DatabaseConnectionInfo = None) -> None:
         super().__init__()
         self.database = DatabaseManager(db_info=db_info)
-
-    def create_authentication_table(self) -> bool:
-        """Create authentication table in the authentication database."""
-        self.logger.info("Creating authentication table...")
-        query = f"""
-            CREATE TABLE {self.AUTHENTICATION_TABLE_NAME} (
-                id SERIAL PRIMARY KEY,
-                username VARCHAR(100) UNIQUE NOT NULL,
-                passwd VARCHAR(255) NOT NULL
-            );
-        """
-        status, _ = self.database.execute(query)
-        return status
+        # Passwords already read or written by this manager, keyed by username
+        self._passwords: dict[str, str] = {}
 
     def generate_password(self) -> str:
         """Generate and return a random password string."""
@@ -53,13 +60,20 @@ class AuthenticationManager(WithLogging):
             password (str): Password of the user to be created
 
         Returns:
-            bool: signifies whether the user has been created successfully
+            bool: signifies whether the user has been created successfully. This is False
+                when a user with the same username already exists.
         """
         self.logger.info(f"Creating user {username}...")
-        query = f"INSERT INTO {self.AUTHENTICATION_TABLE_NAME} (username, passwd) VALUES (%s, %s);"
-        vars = (username, password)
-        status, _ = self.database.execute(query=query, vars=vars)
-        return status
+        status, results = self.database.execute(
+            query=self.INSERT_USER_QUERY, vars=(username, password)
+        )
+        if not status:
+            return False
+        if not results:
+            self.logger.info(f"User {username} already exists.")
+            return False
+        self._passwords[username] = password
+        return True
 
     def delete_user(self, username: str) -> bool:
         """Delete a user with given username.
@@ -71,47 +85,54 @@ class AuthenticationManager(WithLogging):
             bool: signifies whether the user has been deleted successfully
         """
         self.logger.info(f"Deleting user {username}...")
-        query = f"DELETE FROM {self.AUTHENTICATION_TABLE_NAME} WHERE username = %s;"
-        vars = (username,)
-        status, _ = self.database.execute(query=query, vars=vars)
+        status, _ = self.database.execute(query=self.DELETE_USER_QUERY, vars=(username,))
+        self._passwords.pop(username, None)
         return status
 
     def get_password(self, username: str) -> str:
         """Returns the password for the given username."""
+        if username in self._passwords:
+            return self._passwords[username]
         query = f"SELECT passwd FROM {self.AUTHENTICATION_TABLE_NAME} WHERE username = %s"
         vars = (username,)
         status, results = self.database.execute(query=query, vars=vars)
         if not status or len(results) == 0:
             raise Exception("Could not fetch password from authentication database.")
-        password = results[0][0]
+        password = self._passwords[username] = results[0][0]
         return password
 
     def set_password(self, username: str, password: str) -> str:
         """Set a new password for the given username."""
-        query = f"UPDATE {self.AUTHENTICATION_TABLE_NAME} SET passwd = %s WHERE username = %s"
-        vars = (
-            password,
-            username,
+        status, _ = self.database.execute(
+            query=self.UPDATE_PASSWORD_QUERY, vars=(password, username)
         )
-        status, _ = self.database.execute(query=query, vars=vars)
         if not status:
             raise Exception(f"Could not update password of {username}.")
-
-    def create_admin_user(self) -> bool:
-        """Create a default admin user in the authentication database."""
-        password = self.generate_password()
-        return self.create_user(self.DEFAULT_ADMIN_USERNAME, password)
+        self._passwords[username] = password
 
     def prepare_auth_db(self) -> None:
-        """Prepare the authentication database in PostgreSQL."""
+        """Prepare the authentication database in PostgreSQL.
+
+        The authentication table and the default admin user are created in a single
+        round-trip to the database server.
+        """
         self.logger.info("Preparing auth db...")
-        self.create_authentication_table()
-        self.create_admin_user()
+        password = self.generate_password()
+        query = self.CREATE_TABLE_QUERY + self.INSERT_USER_QUERY
+        status, results = self.database.execute(
+            query=query, vars=(self.DEFAULT_ADMIN_USERNAME, password)
+        )
+        if status and results:
+            self._passwords[self.DEFAULT_ADMIN_USERNAME] = password
 
     def remove_auth_db(self) -> None:
         """Remove authentication database from PostgreSQL."""
+        sql = import_psycopg2().sql
+
         self.logger.info("Removing auth_db...")
-        query = f"DROP DATABASE {self.database.db_info.dbname} WITH (FORCE);"
+        query = sql.SQL("DROP DATABASE {} WITH (FORCE);").format(
+            sql.Identifier(self.database.db_info.dbname)
+        )
 
         # Using POSTGRESQL_DEFAULT_DATABASE because a database can't be dropped
         # while being connected to itself.
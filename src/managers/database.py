@@ -5,8 +5,11 @@
 
 """Database connection manager."""
 
-
-import psycopg2
+import ctypes
+import functools
+import os
+from contextlib import closing
+from typing import TYPE_CHECKING
 
 from constants import (
     POSTGRESQL_DEFAULT_DATABASE,
@@ -14,6 +17,32 @@ from constants import (
 from core.domain import DatabaseConnectionInfo
 from utils.logging import WithLogging
 
+# psycopg2 is imported lazily with import_psycopg2(), so that only the hooks that
+# talk to PostgreSQL pay for loading libpq and the C extension.
+if TYPE_CHECKING:
+    import psycopg2.extensions
+    from psycopg2 import sql
+
+# libpq is not installed in the charm container, but shipped inside the lib/ folder of the charm
+LIBPQ_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "lib", "libpq.so.5")
+
+
+@functools.cache
+def import_psycopg2():
+    """Import psycopg2, after loading the libpq library it links against.
+
+    Loading libpq globally lets the dynamic linker resolve it when the psycopg2 C extension
+    is imported, without having to run the charm with LD_LIBRARY_PATH set.
+    """
+    # The library is only shipped in the packed charm, e.g. it is missing when running tests
+    if os.path.exists(LIBPQ_PATH):
+        ctypes.CDLL(LIBPQ_PATH, mode=ctypes.RTLD_GLOBAL)
+
+    import psycopg2
+    import psycopg2.sql
+
+    return psycopg2
+
 
 class DatabaseManager(WithLogging):
     """Manager class encapsulating various database operations."""
@@ -21,12 +50,27 @@ class DatabaseManager(WithLogging):
     def __init__(self, db_info: DatabaseConnectionInfo):
         self.db_info = db_info
 
-    def execute(self, query: str, vars=None, dbname: str = None) -> tuple[bool, list]:
+    def connect(self, dbname: str) -> "psycopg2.extensions.connection":
+        """Open a new connection to the given database."""
+        psycopg2 = import_psycopg2()
+
+        host, port = self.db_info.endpoint.split(":")
+        return psycopg2.connect(
+            host=host,
+            port=int(port),
+            user=self.db_info.username,
+            password=self.db_info.password,
+            dbname=dbname,
+        )
+
+    def execute(
+        self, query: "str | sql.Composable", vars=None, dbname: str = None
+    ) -> tuple[bool, list]:
         """Execute a SQL query by connecting to a given database.
 
         Args:
             dbname (str): The name of the database to connect to while executing the query
-            query (str): The query to be executed
+            query (str | sql.Composable): The query to be executed
             vars (_type_, optional): The variables to be substituted to placeholders in `query`. Defaults to None.
 
         Returns:
@@ -34,40 +78,27 @@ class DatabaseManager(WithLogging):
                 and a list of the rows that were returned by the query. The list is empty if no
                 rows were returned when executing the query.
         """
+        psycopg2 = import_psycopg2()
+
         if not dbname:
             dbname = self.db_info.dbname
-        connection = None
-        cursor = None
-        host, port = self.db_info.endpoint.split(":")
         try:
-            connection = psycopg2.connect(
-                host=host,
-                port=int(port),
-                user=self.db_info.username,
-                password=self.db_info.password,
-                dbname=dbname,
-            )
-            connection.autocommit = True
-            cursor = connection.cursor()
-            cursor.execute(query=query, vars=vars)
-            connection.commit()
-            try:
-                result = cursor.fetchall()
-            except psycopg2.ProgrammingError:
-                result = []
+            with closing(self.connect(dbname)) as connection:
+                connection.autocommit = True
+                with connection.cursor() as cursor:
+                    cursor.execute(query=query, vars=vars)
+                    try:
+                        result = cursor.fetchall()
+                    except psycopg2.ProgrammingError:
+                        result = []
             return True, result
         except Exception as e:
             self.logger.warning(f"PostgreSQL connection not successful. Reason: {e}")
             return False, []
-        finally:
-            if cursor:
-                cursor.close()
-            if connection:
-                connection.close()
 
     def verify(
         self,
     ) -> bool:
         """Verify whether the database connection is valid or not."""
-        status, _ = self.execute(POSTGRESQL_DEFAULT_DATABASE, "SELECT 1;")
+        status, _ = self.execute(query="SELECT 1;", dbname=POSTGRESQL_DEFAULT_DATABASE)
         return status
@@ -5,18 +5,87 @@
 
 """K8s manager."""
 
-import re
+import functools
 
+import lightkube
 import ops
-from lightkube import Client
+from lightkube.config.kubeconfig import KubeConfig
 from lightkube.core.exceptions import ApiError
 from lightkube.resources.core_v1 import Namespace, ServiceAccount
-from spark8t.services import K8sServiceAccountRegistry, LightKube
 
 from core.domain import SparkServiceAccountInfo
 from core.workload import KyuubiWorkloadBase
 from utils.logging import WithLogging
 
+# Spark properties holding an Azure storage account key are named
+# spark.hadoop.fs.azure.account.key.<account>.dfs.core.windows.net
+AZURE_STORAGE_KEY_PREFIX = "spark.hadoop.fs.azure.account.key."
+AZURE_STORAGE_KEY_SUFFIX = ".dfs.core.windows.net="
+
+
+@functools.cache
+def get_lightkube_client() -> lightkube.Client:
+    """Return the lightkube client shared by all the K8s calls of the hook process.
+
+    Reusing the client avoids parsing the kubeconfig and opening a new HTTP session
+    for every request made to the K8s API.
+    """
+    return lightkube.Client()
+
+
+@functools.cache
+def get_spark_master() -> str:
+    """Return the Spark master URL, pointing to the API server of the K8s cluster.
+
+    The address does not change during the hook, so the kubeconfig is only loaded once. It is
+    read with the same lookup as lightkube.Client, without building the HTTP client.
+    """
+    cluster_address = KubeConfig.from_env().get().cluster.server
+    return f"k8s://{cluster_address}"
+
+
+@functools.cache
+def get_service_account_registry():
+    """Return the Spark8t registry of service accounts, shared by all the lookups of the hook."""
+    # spark8t is imported lazily, as it is only needed when a service account is related
+    from spark8t.services import K8sServiceAccountRegistry, LightKube
+
+    return K8sServiceAccountRegistry(LightKube(None, None))
+
+
+@functools.lru_cache(maxsize=8)
+def get_service_account(account_id: str):
+    """Return the Spark8t service account with the given "namespace:name" id.
+
+    Both the status checks and the Spark configuration read the service account, so the
+    lookup in the K8s cluster is memoized for the hook. Failed lookups are not memoized.
+    """
+    return get_service_account_registry().get(account_id)
+
+
+# The existence checks are memoized for the lifetime of the hook process, so that
+# repeated status evaluations do not hit the K8s API again.
+
+
+@functools.lru_cache(maxsize=32)
+def namespace_exists(namespace: str) -> bool:
+    """Return whether the given namespace exists in the K8s cluster."""
+    try:
+        get_lightkube_client().get(Namespace, name=namespace)
+    except ApiError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=32)
+def service_account_exists(namespace: str, service_account: str) -> bool:
+    """Return whether the given service account exists in the given namespace."""
+    try:
+        get_lightkube_client().get(ServiceAccount, name=service_account, namespace=namespace)
+    except ApiError:
+        return False
+    return True
+
 
 class K8sManager(WithLogging):
     """Class that encapsulates various utilities related to K8s."""
@@ -30,26 +99,19 @@ class K8sManager(WithLogging):
 
     def is_namespace_valid(self):
         """Return whether given namespace exists in K8s cluster."""
-        try:
-            Client().get(Namespace, name=self.namespace)
-        except ApiError:
-            return False
-        return True
+        return namespace_exists(self.namespace)
 
     def is_service_account_valid(self):
         """Return whether given service account in the given namespace exists in K8s cluster."""
-        try:
-            Client().get(ServiceAccount, name=self.service_account, namespace=self.namespace)
-        except ApiError:
-            return False
-        return True
+        return service_account_exists(self.namespace, self.service_account)
 
     def verify(self) -> bool:
         """Verify service account information."""
         return self.is_namespace_valid() and self.is_service_account_valid()
 
-    def get_properties(self) -> list[str]:
-        """Get Spark properties associated with this service account."""
+    @functools.cached_property
+    def properties(self) -> list[str]:
+        """Spark properties associated with this service account, read once per manager."""
         command = " ".join(
             [
                 "python3",
@@ -73,20 +135,20 @@ class K8sManager(WithLogging):
 
     def is_s3_configured(self) -> bool:
         """Return whether S3 object storage backend has been configured."""
-        pattern = r"spark\.hadoop\.fs\.s3a\.secret\.key=.*"
-        return any(re.match(pattern, prop) for prop in self.get_properties())
+        return any(prop.startswith("spark.hadoop.fs.s3a.secret.key=") for prop in self.properties)
 
     def is_azure_storage_configured(self) -> bool:
         """Return whether Azure object storage backend has been configured."""
-        pattern = r"spark\.hadoop\.fs\.azure\.account\.key\..*\.dfs\.core\.windows\.net=.*"
-        return any(re.match(pattern, prop) for prop in self.get_properties())
+        return any(
+            prop.find(AZURE_STORAGE_KEY_SUFFIX, len(AZURE_STORAGE_KEY_PREFIX)) != -1
+            for prop in self.properties
+            if prop.startswith(AZURE_STORAGE_KEY_PREFIX)
+        )
 
     def has_cluster_permissions(self) -> bool:
         """Return whether the service account has permission to read Spark configurations from the cluster."""
-        interface = LightKube(None, None)
-        registry = K8sServiceAccountRegistry(interface)
         try:
-            registry.get(f"{self.namespace}:{self.service_account}")
+            get_service_account(f"{self.namespace}:{self.service_account}")
         except ApiError:
             return False
         else:
@@ -4,6 +4,8 @@
 
 """Kyuubi manager."""
 
+import hashlib
+
 from config.hive import HiveConfig
 from config.kyuubi import KyuubiConfig
 from config.spark import SparkConfig
@@ -31,9 +33,10 @@ class KyuubiManager(WithLogging):
             existing_content = self.workload.read(file_path)
         except FileNotFoundError:
             existing_content = ""
-        self.logger.debug(f"{file_path=}")
-        self.logger.debug(f"{existing_content=}")
-        self.logger.debug(f"{content=}")
+        # Lazy formatting, so that the file contents are not copied when debug is disabled
+        self.logger.debug("file_path=%r", file_path)
+        self.logger.debug("existing_content=%r", existing_content)
+        self.logger.debug("content=%r", content)
         if existing_content != content:
             self.workload.write(content, file_path)
             return True
@@ -55,27 +58,43 @@ class KyuubiManager(WithLogging):
         service_account_info = None if set_service_account_none else self.context.service_account
         zookeeper_info = None if set_zookeeper_none else self.context.zookeeper
 
+        files = {
+            self.workload.SPARK_PROPERTIES_FILE: SparkConfig(
+                s3_info=s3_info, service_account_info=service_account_info
+            ).contents,
+            self.workload.HIVE_CONFIGURATION_FILE: HiveConfig(db_info=metastore_db_info).contents,
+            self.workload.KYUUBI_CONFIGURATION_FILE: KyuubiConfig(
+                db_info=auth_db_info, zookeeper_info=zookeeper_info
+            ).contents,
+        }
+
+        # The digest of the last written configurations is kept in the workload container, so
+        # that it is lost together with the files whenever the container is recreated.
+        digest = hashlib.blake2b(
+            "\0".join(f"{path}\0{content}" for path, content in files.items()).encode()
+        ).hexdigest()
+        if self.workload.configuration_digest is None:
+            try:
+                self.workload.configuration_digest = self.workload.read(
+                    self.workload.CONFIGURATION_DIGEST_FILE
+                )
+            except FileNotFoundError:
+                self.workload.configuration_digest = ""
+        if self.workload.configuration_digest == digest:
+            self.logger.info("Configurations have not changed; skipping update of the workload.")
+            return
+
+        updated = [
+            self._compare_and_update_file(content, file_path)
+            for file_path, content in files.items()
+        ]
+
         # Restart workload only if some configuration has changed.
-        if any(
-            [
-                self._compare_and_update_file(
-                    SparkConfig(
-                        s3_info=s3_info, service_account_info=service_account_info
-                    ).contents,
-                    self.workload.SPARK_PROPERTIES_FILE,
-                ),
-                self._compare_and_update_file(
-                    HiveConfig(db_info=metastore_db_info).contents,
-                    self.workload.HIVE_CONFIGURATION_FILE,
-                ),
-                self._compare_and_update_file(
-                    KyuubiConfig(db_info=auth_db_info, zookeeper_info=zookeeper_info).contents,
-                    self.workload.KYUUBI_CONFIGURATION_FILE,
-                ),
-            ]
-        ):
+        if any(updated):
             self.workload.restart()
         else:
             self.logger.info(
                 "Workload restart skipped because the configurations have not changed."
             )
+        self.workload.write(digest, self.workload.CONFIGURATION_DIGEST_FILE)
+        self.workload.configuration_digest = digest
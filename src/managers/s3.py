@@ -5,10 +5,9 @@
 
 """S3 connection manager."""
 
+import time
 from functools import cached_property
-
-import boto3
-from botocore.exceptions import ClientError, NoCredentialsError
+from typing import MutableMapping
 
 from core.domain import S3ConnectionInfo
 from utils.logging import WithLogging
@@ -17,19 +16,53 @@ from utils.logging import WithLogging
 class S3Manager(WithLogging):
     """Class representing credentials and endpoints to connect to S3."""
 
+    # Seconds during which a successful verification recorded across hooks is reused
+    VERIFICATION_TTL = 60
+
     def __init__(self, s3_info: S3ConnectionInfo):
         self.s3_info = s3_info
 
     @cached_property
     def session(self):
         """Return the S3 session to be used when connecting to S3."""
+        # boto3 is imported lazily, as it is only needed when an S3 relation exists
+        import boto3
+
         return boto3.session.Session(
             aws_access_key_id=self.s3_info.access_key,
             aws_secret_access_key=self.s3_info.secret_key,
         )
 
-    def verify(self) -> bool:
-        """Verify S3 credentials."""
+    def verify(self, state: MutableMapping | None = None) -> bool:
+        """Verify S3 credentials, reusing the outcome of a previous check of the same ones.
+
+        Args:
+            state: mapping persisted across hooks, where the last successful verification
+                is recorded for the S3 relation and reused for VERIFICATION_TTL seconds. It
+                must be cleared whenever the S3 credentials change.
+        """
+        relation_id = self.s3_info.relation.id
+        if (
+            state is not None
+            and state.get("relation-id") == relation_id
+            and time.time() - state.get("timestamp", 0) < self.VERIFICATION_TTL
+        ):
+            return True
+
+        valid = self._verify()
+        if state is not None:
+            state.clear()
+            # Failures are not persisted, as they may come from an endpoint or a permission
+            # issue fixed later on without rotating the credentials
+            if valid:
+                state.update({"relation-id": relation_id, "timestamp": time.time()})
+
+        return valid
+
+    def _verify(self) -> bool:
+        """Verify S3 credentials against the S3 endpoint."""
+        from botocore.exceptions import ClientError, NoCredentialsError
+
         s3 = self.session.client(
             "s3", endpoint_url=self.s3_info.endpoint or "https://s3.amazonaws.com"
         )
@@ -8,6 +8,7 @@ import typing
 import lightkube
 
 from constants import JDBC_PORT
+from managers.k8s import get_lightkube_client
 from utils.logging import WithLogging
 
 
@@ -27,7 +28,9 @@ class ServiceManager(WithLogging):
         self.unit_name = unit_name
         self.app_name = app_name
         self.service_name = f"{self.app_name}-service"
-        self.lightkube_agent = lightkube.Client()
+        self.lightkube_agent = get_lightkube_client()
+        # Endpoints already resolved, keyed by the value of expose-external
+        self._endpoints: dict[str, str] = {}
 
     @property
     def model_service_domain(self) -> str:
@@ -87,7 +90,20 @@ class ServiceManager(WithLogging):
         return service
 
     def get_service_endpoint(self, expose_external: str):
-        """Returns the endpoint that can be used to connect to the service."""
+        """Returns the endpoint that can be used to connect to the service.
+
+        An available endpoint is resolved only once, until the service is created or deleted
+        again. A missing endpoint is looked up again on the next call.
+        """
+        if endpoint := self._endpoints.get(expose_external):
+            return endpoint
+        endpoint = self._get_service_endpoint(expose_external)
+        if endpoint:
+            self._endpoints[expose_external] = endpoint
+        return endpoint
+
+    def _get_service_endpoint(self, expose_external: str) -> str:
+        """Resolve the endpoint that can be used to connect to the service."""
         service = self.get_service()
         if not service:
             return ""
@@ -118,6 +134,7 @@ class ServiceManager(WithLogging):
 
     def delete_service(self):
         """Delete the existing managed K8s service."""
+        self._endpoints.clear()
         try:
             self.lightkube_agent.delete(
                 res=lightkube.resources.core_v1.Service,
@@ -139,6 +156,7 @@ class ServiceManager(WithLogging):
 
     def create_service(self, service_type, owner_references):
         """Create the Kubernetes service with desired service type."""
+        self._endpoints.clear()
         desired_service = lightkube.resources.core_v1.Service(
             metadata=lightkube.models.meta_v1.ObjectMeta(
                 name=self.service_name,
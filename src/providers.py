@@ -15,7 +15,6 @@ from ops.framework import Object
 from ops.model import BlockedStatus
 
 from managers.auth import AuthenticationManager
-from managers.service import ServiceManager
 
 logger = logging.getLogger(__name__)
 
@@ -65,18 +64,13 @@ class KyuubiClientProvider(Object):
                 "over auth-db relation endpoint."
             )
         auth = AuthenticationManager(self.charm.context.auth_db)
-        service_manager = ServiceManager(
-            namespace=self.charm.model.name,
-            unit_name=self.charm.unit.name,
-            app_name=self.charm.app.name,
-        )
         try:
             username = f"relation_id_{event.relation.id}"
             password = auth.generate_password()
             auth.create_user(username=username, password=password)
 
-            kyuubi_address = service_manager.get_service_endpoint(
-                expose_external=self.charm.config.expose_external
+            kyuubi_address = self.charm.service_manager.get_service_endpoint(  # type: ignore
+                expose_external=self.charm.context.config.expose_external
             )
             endpoint = f"jdbc:hive2://{kyuubi_address}/" if kyuubi_address else ""
 
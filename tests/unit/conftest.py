@@ -15,6 +15,14 @@ from constants import (
     SPARK_SERVICE_ACCOUNT_REL,
     ZOOKEEPER_REL,
 )
+from managers.k8s import (
+    get_lightkube_client,
+    get_service_account,
+    get_service_account_registry,
+    get_spark_master,
+    namespace_exists,
+    service_account_exists,
+)
 
 
 @pytest.fixture
@@ -123,3 +131,15 @@ def mock_lightkube_client():
     """A fixture to run unit tests even in non K8s environment."""
     with patch("lightkube.Client") as mock_client:
         yield mock_client
+
+
+@pytest.fixture(autouse=True)
+def clear_hook_caches():
+    """Clear the module-level caches, that would otherwise outlive the hook of a test."""
+    yield
+    get_spark_master.cache_clear()
+    get_service_account.cache_clear()
+    get_service_account_registry.cache_clear()
+    get_lightkube_client.cache_clear()
+    namespace_exists.cache_clear()
+    service_account_exists.cache_clear()
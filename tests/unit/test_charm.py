@@ -4,10 +4,11 @@
 # See LICENSE file for licensing details.
 
 import logging
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import patch
 
-from ops.testing import Container, Context, Relation, State
+from ops.testing import BlockedStatus, Container, Context, PeerRelation, Relation, State
 
 from constants import KYUUBI_CONTAINER_NAME, KYUUBI_OCI_IMAGE
 from core.domain import Status
@@ -85,6 +86,65 @@ def test_s3_relation_invalid_credentials(
     assert out.unit_status == Status.INVALID_CREDENTIALS.value
 
 
+@patch("managers.s3.S3Manager._verify", return_value=True)
+@patch("managers.k8s.K8sManager.is_namespace_valid", return_value=True)
+@patch("managers.k8s.K8sManager.is_service_account_valid", return_value=True)
+@patch("config.spark.SparkConfig._get_spark_master", return_value="k8s://https://spark.master")
+@patch("config.spark.SparkConfig._sa_conf", return_value={})
+def test_s3_verification_is_reused_across_hooks(
+    mock_sa_conf,
+    mock_get_master,
+    mock_valid_sa,
+    mock_valid_ns,
+    mock_s3_verify,
+    kyuubi_context: Context,
+    kyuubi_container: Container,
+    s3_relation: Relation,
+) -> None:
+    state = State(
+        relations=[s3_relation],
+        containers=[kyuubi_container],
+    )
+    out = kyuubi_context.run(kyuubi_context.on.relation_changed(s3_relation), state)
+    assert out.unit_status == Status.MISSING_INTEGRATION_HUB.value
+
+    out = kyuubi_context.run(kyuubi_context.on.update_status(), out)
+    assert out.unit_status == Status.MISSING_INTEGRATION_HUB.value
+    mock_s3_verify.assert_called_once()
+
+    # New credentials are verified again
+    out = kyuubi_context.run(kyuubi_context.on.relation_changed(s3_relation), out)
+    assert out.unit_status == Status.MISSING_INTEGRATION_HUB.value
+    assert mock_s3_verify.call_count == 2
+
+
+@patch("managers.s3.S3Manager._verify", return_value=False)
+@patch("managers.k8s.K8sManager.is_namespace_valid", return_value=True)
+@patch("managers.k8s.K8sManager.is_service_account_valid", return_value=True)
+@patch("config.spark.SparkConfig._get_spark_master", return_value="k8s://https://spark.master")
+@patch("config.spark.SparkConfig._sa_conf", return_value={})
+def test_invalid_s3_credentials_are_verified_again(
+    mock_sa_conf,
+    mock_get_master,
+    mock_valid_sa,
+    mock_valid_ns,
+    mock_s3_verify,
+    kyuubi_context: Context,
+    kyuubi_container: Container,
+    s3_relation: Relation,
+) -> None:
+    state = State(
+        relations=[s3_relation],
+        containers=[kyuubi_container],
+    )
+    out = kyuubi_context.run(kyuubi_context.on.relation_changed(s3_relation), state)
+    assert out.unit_status == Status.INVALID_CREDENTIALS.value
+
+    out = kyuubi_context.run(kyuubi_context.on.update_status(), out)
+    assert out.unit_status == Status.INVALID_CREDENTIALS.value
+    assert mock_s3_verify.call_count == 2
+
+
 @patch("managers.s3.S3Manager.verify", return_value=True)
 @patch("managers.k8s.K8sManager.is_namespace_valid", return_value=True)
 @patch("managers.k8s.K8sManager.is_service_account_valid", return_value=True)
@@ -580,3 +640,113 @@ def test_spark_property_priorities(
     assert (
         spark_properties["spark.hadoop.fs.s3a.endpoint"] == s3_relation.remote_app_data["endpoint"]
     )
+
+
+@patch("events.base.BaseEventHandler.get_app_status")
+def test_failed_refresh_status_is_preserved(
+    mock_get_app_status,
+    kyuubi_context: Context,
+    kyuubi_container: Container,
+) -> None:
+    upgrade_relation = PeerRelation(endpoint="upgrade", local_unit_data={"state": "failed"})
+    state = State(
+        leader=False,
+        relations=[upgrade_relation],
+        containers=[kyuubi_container],
+        unit_status=BlockedStatus("upgrade failed"),
+    )
+    out = kyuubi_context.run(kyuubi_context.on.update_status(), state)
+    assert out.unit_status == BlockedStatus("upgrade failed")
+    mock_get_app_status.assert_not_called()
+
+
+@patch("managers.s3.S3Manager.verify", return_value=True)
+@patch("managers.k8s.K8sManager.is_namespace_valid", return_value=True)
+@patch("managers.k8s.K8sManager.is_service_account_valid", return_value=True)
+@patch("managers.k8s.K8sManager.is_s3_configured", return_value=True)
+@patch("managers.k8s.K8sManager.has_cluster_permissions", return_value=True)
+@patch(
+    "managers.service.ServiceManager.get_service_endpoint",
+    return_value="10.10.10.10:10009",
+)
+@patch("config.spark.SparkConfig._get_spark_master", return_value="k8s://https://spark.master")
+@patch("config.spark.SparkConfig._sa_conf", return_value={})
+@patch("core.workload.kyuubi.KyuubiWorkload.restart")
+def test_unchanged_configurations_skip_restart(
+    mock_restart,
+    mock_sa_conf,
+    mock_get_master,
+    mock_service_endpoint,
+    mock_has_cluster_permissions,
+    mock_s3_configured,
+    mock_valid_sa,
+    mock_valid_ns,
+    mock_s3_verify,
+    tmp_path,
+    kyuubi_context: Context,
+    kyuubi_container: Container,
+    s3_relation: Relation,
+    spark_service_account_relation: Relation,
+) -> None:
+    state = State(
+        relations=[s3_relation, spark_service_account_relation],
+        containers=[kyuubi_container],
+    )
+    out = kyuubi_context.run(kyuubi_context.on.relation_changed(s3_relation), state)
+    assert mock_restart.call_count == 1
+    assert (tmp_path / Path(KyuubiWorkload.CONFIGURATION_DIGEST_FILE).relative_to("/opt")).exists()
+
+    out = kyuubi_context.run(kyuubi_context.on.relation_changed(s3_relation), out)
+    assert mock_restart.call_count == 1
+    assert out.unit_status == Status.ACTIVE.value
+
+
+@patch("managers.s3.S3Manager.verify", return_value=True)
+@patch("managers.k8s.K8sManager.is_namespace_valid", return_value=True)
+@patch("managers.k8s.K8sManager.is_service_account_valid", return_value=True)
+@patch("managers.k8s.K8sManager.is_s3_configured", return_value=True)
+@patch("managers.k8s.K8sManager.has_cluster_permissions", return_value=True)
+@patch(
+    "managers.service.ServiceManager.get_service_endpoint",
+    return_value="10.10.10.10:10009",
+)
+@patch("config.spark.SparkConfig._get_spark_master", return_value="k8s://https://spark.master")
+@patch("config.spark.SparkConfig._sa_conf", return_value={})
+@patch("core.workload.kyuubi.KyuubiWorkload.restart")
+def test_changed_configurations_restart(
+    mock_restart,
+    mock_sa_conf,
+    mock_get_master,
+    mock_service_endpoint,
+    mock_has_cluster_permissions,
+    mock_s3_configured,
+    mock_valid_sa,
+    mock_valid_ns,
+    mock_s3_verify,
+    tmp_path,
+    kyuubi_context: Context,
+    kyuubi_container: Container,
+    s3_relation: Relation,
+    spark_service_account_relation: Relation,
+) -> None:
+    state = State(
+        relations=[s3_relation, spark_service_account_relation],
+        containers=[kyuubi_container],
+    )
+    out = kyuubi_context.run(kyuubi_context.on.relation_changed(s3_relation), state)
+    assert mock_restart.call_count == 1
+    assert (tmp_path / Path(KyuubiWorkload.CONFIGURATION_DIGEST_FILE).relative_to("/opt")).exists()
+
+    # Rotate the S3 credentials, once the digest of the previous configurations exists
+    relation = out.get_relation(s3_relation.id)
+    relation = replace(
+        relation, remote_app_data={**relation.remote_app_data, "secret-key": "new-secret-key"}
+    )
+    out = kyuubi_context.run(
+        kyuubi_context.on.relation_changed(relation),
+        replace(out, relations=[relation, out.get_relation(spark_service_account_relation.id)]),
+    )
+    assert mock_restart.call_count == 2
+
+    spark_properties = tmp_path / Path(KyuubiWorkload.SPARK_PROPERTIES_FILE).relative_to("/etc")
+    assert "spark.hadoop.fs.s3a.secret.key=new-secret-key" in spark_properties.read_text()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+# Copyright 2024 Canonical Limited
+# See LICENSE file for licensing details.
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
+
+from common.relation.spark_sa import Diff, diff
+
+
+def make_event(old_data: dict | None, new_data: dict, with_app: bool = True):
+    """Return a relation changed event, the local bucket and its databag."""
+    bucket, remote_app = Mock(), Mock()
+    local_databag = {} if old_data is None else {"data": json.dumps(old_data)}
+    local = MagicMock(wraps=local_databag)
+    event = SimpleNamespace(
+        relation=SimpleNamespace(data={bucket: local, remote_app: dict(new_data)}),
+        app=remote_app if with_app else None,
+    )
+    return event, bucket, local
+
+
+def test_diff_without_bucket() -> None:
+    event, _, local = make_event({"a": "1"}, {"b": "2"})
+
+    assert diff(event, None) == Diff(set(), set(), set())
+    local.get.assert_not_called()
+
+
+def test_diff_added_changed_deleted() -> None:
+    event, bucket, local = make_event(
+        {"kept": "1", "changed": "1", "deleted": "1"},
+        {"kept": "1", "changed": "2", "added": "1", "data": "ignored"},
+    )
+
+    assert diff(event, bucket) == Diff({"added"}, {"changed"}, {"deleted"})
+    local.update.assert_called_once()
+    assert json.loads(local.update.call_args.args[0]["data"]) == {
+        "kept": "1",
+        "changed": "2",
+        "added": "1",
+    }
+
+
+def test_diff_first_event() -> None:
+    event, bucket, local = make_event(None, {"service-account": "kyuubi"})
+
+    assert diff(event, bucket) == Diff({"service-account"}, set(), set())
+    local.update.assert_called_once()
+
+
+def test_diff_unchanged_skips_write() -> None:
+    event, bucket, local = make_event({"a": "1", "b": "2"}, {"a": "1", "b": "2"})
+
+    assert diff(event, bucket) == Diff(set(), set(), set())
+    local.update.assert_not_called()
+
+
+def test_diff_without_app() -> None:
+    event, bucket, local = make_event({"a": "1", "b": "2"}, {}, with_app=False)
+
+    assert diff(event, bucket) == Diff(set(), set(), {"a", "b"})
+    local.update.assert_called_once_with({"data": "{}"})
+
+
+def test_diff_without_app_and_data_skips_write() -> None:
+    event, bucket, local = make_event(None, {}, with_app=False)
+
+    assert diff(event, bucket) == Diff(set(), set(), set())
+    local.update.assert_not_called()